@@ -23,6 +23,7 @@ Example:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
@@ -33,13 +34,15 @@ from core.dependencies import get_rental_service, get_dvd_token_guard
 router = APIRouter()
 
 
-@router.get("/{customer_id}/rentals", response_model=List[RentalRead])
+@router.get(
+    "/{customer_id}/rentals", response_model=None, responses={200: {"model": List[RentalRead]}}
+)
 async def get_customer_rentals(
     customer_id: int,
     skip: int = 0,
     limit: int = 100,
     service: RentalService = Depends(get_rental_service),
-) -> List[RentalRead]:
+) -> ORJSONResponse:
     """
     Get all rentals for a specific customer with pagination.
 
@@ -50,10 +53,12 @@ async def get_customer_rentals(
         service: Rental service (injected)
 
     Returns:
-        List of customer rentals
+        JSON response with the list of customer rentals (validated into
+        RentalRead by the service and dumped directly, without a second
+        response_model pass)
     """
     rentals = await service.get_rentals(skip=skip, limit=limit, customer_id=customer_id)
-    return rentals
+    return ORJSONResponse([rental.model_dump(mode="json") for rental in rentals])
 
 
 @router.post(
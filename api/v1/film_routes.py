@@ -27,6 +27,7 @@ Example:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
@@ -87,13 +88,13 @@ async def create_film(
         )
 
 
-@router.get("/", response_model=List[FilmRead])
+@router.get("/", response_model=None, responses={200: {"model": List[FilmRead]}})
 async def get_films(
     skip: int = 0,
     limit: int = 100,
     category: Optional[str] = None,
     service: FilmService = Depends(get_film_service),
-) -> List[FilmRead]:
+) -> ORJSONResponse:
     """
     Get all films with pagination and optional category filter.
 
@@ -104,9 +105,12 @@ async def get_films(
         service: Film service (injected)
 
     Returns:
-        List of films
+        JSON response with the list of films. FilmService validates each row
+        into FilmRead, so the models are dumped directly instead of going
+        through a second response_model validation.
     """
-    return await service.get_films(skip=skip, limit=limit, category=category)
+    films = await service.get_films(skip=skip, limit=limit, category=category)
+    return ORJSONResponse([film.model_dump(mode="json") for film in films])
 
 
 @router.get("/{film_id}", response_model=FilmRead)
@@ -23,6 +23,7 @@ Example:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
@@ -102,12 +103,12 @@ async def create_rental(
         )
 
 
-@router.get("/", response_model=List[RentalRead])
+@router.get("/", response_model=None, responses={200: {"model": List[RentalRead]}})
 async def get_rentals(
     skip: int = 0,
     limit: int = 100,
     service: RentalService = Depends(get_rental_service),
-) -> List[RentalRead]:
+) -> ORJSONResponse:
     """
     Get all rentals with pagination.
 
@@ -117,9 +118,11 @@ async def get_rentals(
         service: Rental service (injected)
 
     Returns:
-        List of rentals
+        JSON response with the list of rentals (validated into RentalRead by
+        the service and dumped directly, without a second response_model pass)
     """
-    return await service.get_rentals(skip=skip, limit=limit)
+    rentals = await service.get_rentals(skip=skip, limit=limit)
+    return ORJSONResponse([rental.model_dump(mode="json") for rental in rentals])
 
 
 @router.get("/{rental_id}", response_model=RentalRead)
@@ -10,6 +10,7 @@ The application uses:
     - Semantic Kernel for AI operations
     - PostgreSQL for the database
     - Structured JSON logging
+    - orjson for rendering JSON responses
 
 Example:
     Run the application:
@@ -21,6 +22,7 @@ Example:
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from core.settings import settings
 from core.logging import setup_logging, get_logger
@@ -58,6 +60,7 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -20,7 +20,7 @@ Example:
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, text
 from sqlalchemy.sql import Select, Delete
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from domain.models.film import Film
 from domain.schemas.film import FilmCreate, FilmUpdate
 
@@ -130,6 +130,22 @@ class FilmRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, film_ids: Sequence[int]) -> List[Film]:
+        """
+        Get several films by ID in a single query.
+
+        Args:
+            film_ids: Film IDs to look up
+
+        Returns:
+            List of film entities found (missing IDs are skipped, order is not guaranteed)
+        """
+        if not film_ids:
+            return []
+        stmt: Select[tuple[Film]] = select(Film).where(Film.id.in_(film_ids))  # type: ignore[union-attr]
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_all(
         self,
         skip: int = 0,
@@ -18,9 +18,9 @@ Example:
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import update, delete, text
+from sqlalchemy import update, delete, text, bindparam
 from sqlalchemy.sql import Update, Delete
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from domain.models.rental import Rental
 from domain.schemas.rental import RentalCreate, RentalUpdate
 
@@ -116,6 +116,36 @@ class RentalRepository:
             return Rental(**rental_dict)
         return None
 
+    async def get_by_ids(self, rental_ids: Sequence[int]) -> List[Rental]:
+        """
+        Get several rentals by ID in a single query.
+
+        Args:
+            rental_ids: Rental IDs to look up
+
+        Returns:
+            List of rental entities found (missing IDs are skipped, order is not guaranteed)
+        """
+        if not rental_ids:
+            return []
+        # Use raw SQL to match Pagila schema; expanding bind renders IN (...)
+        sql_query = text(
+            """
+            SELECT 
+                rental.rental_id as id,
+                rental.inventory_id,
+                rental.customer_id,
+                rental.staff_id,
+                rental.rental_date,
+                rental.return_date,
+                rental.last_update
+            FROM rental
+            WHERE rental.rental_id IN :rental_ids
+        """
+        ).bindparams(bindparam("rental_ids", expanding=True))
+        result = await self.session.execute(sql_query, {"rental_ids": list(rental_ids)})
+        return [Rental(**dict(row._mapping)) for row in result.fetchall()]
+
     async def get_all(
         self,
         skip: int = 0,
@@ -14,7 +14,7 @@ Example:
     ```
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from domain.repositories.film_repository import FilmRepository
 from domain.schemas.film import FilmCreate, FilmUpdate, FilmRead
 
@@ -65,6 +65,22 @@ class FilmService:
             return None
         return FilmRead.model_validate(film)
 
+    async def get_films_by_ids(self, film_ids: Sequence[int]) -> Dict[int, FilmRead]:
+        """
+        Get several films by ID with one repository call.
+
+        Prefer this over awaiting get_film() in a loop: it issues a single
+        ``WHERE film_id IN (...)`` query instead of one round-trip per ID.
+
+        Args:
+            film_ids: Film IDs (duplicates are ignored)
+
+        Returns:
+            Mapping of film ID to film; IDs that do not exist are absent
+        """
+        films = await self.repository.get_by_ids(list(dict.fromkeys(film_ids)))
+        return {film.id: FilmRead.model_validate(film) for film in films if film.id is not None}
+
     async def get_films(
         self,
         skip: int = 0,
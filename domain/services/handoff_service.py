@@ -4,13 +4,21 @@ This service handles agent orchestration using Semantic Kernel's HandoffOrchestr
 It manages conversation context and routes questions between SearchAgent and LLMAgent.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import asyncio
+import structlog
 from semantic_kernel import Kernel
 from semantic_kernel.agents.runtime import InProcessRuntime
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.agents.orchestration import create_handoff_orchestration
 from core.logging import get_logger
+from core.settings import settings
+
+logger = get_logger(__name__)
+
+# The extraction helpers only get a logger for their per-message debug output
+# when DEBUG logging is configured, so the usual path skips those calls
+_DEBUG_LOGGING = settings.log_level.upper() == "DEBUG"
 
 
 class HandoffService:
@@ -119,7 +127,7 @@ class HandoffService:
                 )
             else:
                 # Fallback to extracting from final_value if tracker is empty
-                answer = self._extract_answer(final_value)
+                answer = _extract_answer(final_value, self.logger if _DEBUG_LOGGING else None)
                 self.logger.info(
                     "Using final_value as fallback", answer_length=len(answer) if answer else 0
                 )
@@ -163,104 +171,110 @@ class HandoffService:
                 except Exception:
                     pass  # Ignore errors when stopping runtime
 
-    def _extract_answer(self, final_value: Any) -> str:
-        """Extract answer text from orchestration result.
 
-        Args:
-            final_value: Result from orchestration (typically ChatMessageContent or list)
+def _extract_answer(final_value: Any, debug_logger: Optional[structlog.BoundLogger] = None) -> str:
+    """Extract answer text from orchestration result.
 
-        Returns:
-            Extracted answer text
-        """
-        if not final_value:
-            return ""
+    Args:
+        final_value: Result from orchestration (typically ChatMessageContent or list)
+        debug_logger: Logger for debug diagnostics; no debug output when omitted
 
-        self.logger.debug(
+    Returns:
+        Extracted answer text
+    """
+    if not final_value:
+        return ""
+
+    if debug_logger is not None:
+        debug_logger.debug(
             "Extracting answer from final_value",
             final_value_type=type(final_value).__name__,
             is_list=isinstance(final_value, list),
-            has_content=hasattr(final_value, "content") if final_value else False,
-            has_text=hasattr(final_value, "text") if final_value else False,
-            has_items=hasattr(final_value, "items") if final_value else False,
+            has_content=hasattr(final_value, "content"),
+            has_text=hasattr(final_value, "text"),
+            has_items=hasattr(final_value, "items"),
         )
 
-        # Handle list of messages (common case)
-        if isinstance(final_value, list):
-            if not final_value:
-                return ""
-
-            # Get the last message (most recent response)
-            last_message = final_value[-1]
-            self.logger.debug(
+    # Handle list of messages (common case)
+    if isinstance(final_value, list):
+        # Get the last message (most recent response)
+        last_message = final_value[-1]
+        if debug_logger is not None:
+            debug_logger.debug(
                 "Processing last message from list",
                 message_type=type(last_message).__name__,
                 list_length=len(final_value),
             )
-            return self._extract_from_message(last_message)
+        return _extract_from_message(last_message, debug_logger)
 
-        # Handle single message
-        return self._extract_from_message(final_value)
+    # Handle single message
+    return _extract_from_message(final_value, debug_logger)
 
-    def _extract_from_message(self, message: Any) -> str:
-        """Extract text content from a single message object.
 
-        Args:
-            message: Message object (ChatMessageContent or similar)
+def _extract_from_message(
+    message: Any, debug_logger: Optional[structlog.BoundLogger] = None
+) -> str:
+    """Extract text content from a single message object.
 
-        Returns:
-            Extracted text content
-        """
-        if not message:
-            return ""
+    Args:
+        message: Message object (ChatMessageContent or similar)
+        debug_logger: Logger for debug diagnostics; no debug output when omitted
 
-        answer = ""
-
-        # Try direct content attribute first
-        if hasattr(message, "content") and message.content:
-            content = message.content
-            if isinstance(content, str):
-                answer = content
-            else:
-                answer = str(content)
-            self.logger.debug("Extracted from content attribute", length=len(answer))
-
-        # Try text attribute
-        if not answer and hasattr(message, "text") and message.text:
-            answer = str(message.text)
-            self.logger.debug("Extracted from text attribute", length=len(answer))
-
-        # Try items attribute (ChatMessageContent structure)
-        if not answer and hasattr(message, "items") and message.items:
-            try:
-                for item in message.items:
-                    if hasattr(item, "text") and item.text:
-                        answer += str(item.text)
-                    elif hasattr(item, "content") and item.content:
-                        answer += str(item.content)
-                    elif isinstance(item, dict):
-                        if "text" in item and item["text"]:
-                            answer += str(item["text"])
-                        elif "content" in item and item["content"]:
-                            answer += str(item["content"])
-
-                    # Stop after first item with content
-                    if answer.strip():
-                        break
-
-                if answer:
-                    self.logger.debug("Extracted from items attribute", length=len(answer))
-            except (TypeError, AttributeError) as e:
-                self.logger.warning("Error extracting from items", error=str(e))
-
-        # Fallback: convert to string if it's not an OrchestrationResult
-        if not answer:
-            type_name = type(message).__name__
-            if "OrchestrationResult" not in type_name and "Task" not in type_name:
-                answer = str(message)
-                self.logger.debug("Extracted using string conversion", length=len(answer))
-            else:
-                self.logger.warning(
-                    "Skipping string conversion of task/result object", type_name=type_name
-                )
-
-        return answer.strip() if answer else ""
+    Returns:
+        Extracted text content
+    """
+    if not message:
+        return ""
+
+    answer = ""
+
+    # Try direct content attribute first
+    if hasattr(message, "content") and message.content:
+        content = message.content
+        if isinstance(content, str):
+            answer = content
+        else:
+            answer = str(content)
+        if debug_logger is not None:
+            debug_logger.debug("Extracted from content attribute", length=len(answer))
+
+    # Try text attribute
+    if not answer and hasattr(message, "text") and message.text:
+        answer = str(message.text)
+        if debug_logger is not None:
+            debug_logger.debug("Extracted from text attribute", length=len(answer))
+
+    # Try items attribute (ChatMessageContent structure)
+    if not answer and hasattr(message, "items") and message.items:
+        try:
+            for item in message.items:
+                if hasattr(item, "text") and item.text:
+                    answer += str(item.text)
+                elif hasattr(item, "content") and item.content:
+                    answer += str(item.content)
+                elif isinstance(item, dict):
+                    if "text" in item and item["text"]:
+                        answer += str(item["text"])
+                    elif "content" in item and item["content"]:
+                        answer += str(item["content"])
+
+                # Stop after first item with content
+                if answer.strip():
+                    break
+
+            if answer and debug_logger is not None:
+                debug_logger.debug("Extracted from items attribute", length=len(answer))
+        except (TypeError, AttributeError) as e:
+            logger.warning("Error extracting from items", error=str(e))
+
+    # Fallback: convert to string if it's not an OrchestrationResult
+    if not answer:
+        type_name = type(message).__name__
+        if "OrchestrationResult" not in type_name and "Task" not in type_name:
+            answer = str(message)
+            if debug_logger is not None:
+                debug_logger.debug("Extracted using string conversion", length=len(answer))
+        else:
+            logger.warning("Skipping string conversion of task/result object", type_name=type_name)
+
+    return answer.strip() if answer else ""
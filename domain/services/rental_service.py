@@ -14,7 +14,7 @@ Example:
     ```
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from domain.repositories.rental_repository import RentalRepository
 from domain.schemas.rental import RentalCreate, RentalUpdate, RentalRead
 
@@ -65,6 +65,26 @@ class RentalService:
             return None
         return RentalRead.model_validate(rental)
 
+    async def get_rentals_by_ids(self, rental_ids: Sequence[int]) -> Dict[int, RentalRead]:
+        """
+        Get several rentals by ID with one repository call.
+
+        Prefer this over awaiting get_rental() in a loop: it issues a single
+        ``WHERE rental_id IN (...)`` query instead of one round-trip per ID.
+
+        Args:
+            rental_ids: Rental IDs (duplicates are ignored)
+
+        Returns:
+            Mapping of rental ID to rental; IDs that do not exist are absent
+        """
+        rentals = await self.repository.get_by_ids(list(dict.fromkeys(rental_ids)))
+        return {
+            rental.id: RentalRead.model_validate(rental)
+            for rental in rentals
+            if rental.id is not None
+        }
+
     async def get_rentals(
         self,
         skip: int = 0,
@@ -32,6 +32,10 @@ def upgrade() -> None:
     - end_date: Subscription end date (optional)
 
     Uses Alembic's op.create_table() helper function for table creation.
+
+    Also creates a composite index on (customer_id, start_date). PostgreSQL does
+    not index foreign key columns automatically, so without it per-customer
+    lookups and FK checks on customer updates/deletes scan the whole table.
     """
     # Create table using Alembic's helper function op.create_table()
     # This demonstrates using Alembic's helper for table creation
@@ -48,12 +52,25 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id", name="pk_streaming_subscription"),
     )
 
+    # Index the FK column (leading) together with start_date so that
+    # "subscriptions for customer X ordered by date" is served by the index
+    op.create_index(
+        "ix_streaming_subscription_customer_id_start_date",
+        "streaming_subscription",
+        ["customer_id", "start_date"],
+    )
+
 
 def downgrade() -> None:
     """Downgrade database schema.
 
-    Drops the 'streaming_subscription' table, reverting the database
-    to its previous state before this migration was applied.
+    Drops the 'streaming_subscription' table and its customer index, reverting
+    the database to its previous state before this migration was applied.
     """
+    op.drop_index(
+        "ix_streaming_subscription_customer_id_start_date",
+        table_name="streaming_subscription",
+    )
+
     # Drop table using Alembic's helper function op.drop_table()
     op.drop_table("streaming_subscription")
@@ -1,35 +1,55 @@
 """Pytest configuration and fixtures.
 
 This module provides pytest fixtures for testing the FastAPI application.
-It sets up an in-memory SQLite database for testing and provides async
-HTTP client fixtures for making API requests.
+It sets up an in-memory SQLite database for testing (override it with the
+TEST_DATABASE_URL environment variable) and provides async HTTP client
+fixtures for making API requests.
 
 Fixtures:
-    db_session: Async database session with in-memory SQLite database
-    client: Async HTTP client for making API requests
+    event_loop: Session-wide event loop shared by all async fixtures
+    test_schema: Creates the schema and loads tests/fixtures/*.sql once per session
+    db_session: Async database session rolled back after each test
+    http_client: Async HTTP client shared by the whole test session
+    client: The shared HTTP client with this test's database session
+    direct_client: In-process services for calling route handlers directly
+    auth_headers: Pre-built Bearer token headers for protected endpoints
+    auth_json_headers: auth_headers plus the JSON content type
+    created_rental: A rental created for the current test (no HTTP round trip)
     sync_client: Synchronous HTTP client for making API requests
 
+Helpers:
+    fast_json: Parse a response body with orjson
+    create_rental_direct: Create a rental through the service layer
+    RENTAL_DATA, RENTAL_BODY: Default rental payload and its pre-encoded body
+    JSON_HEADERS: Content-Type header for pre-encoded bodies
+
 Example:
     ```python
-    import pytest
-
-    @pytest.mark.asyncio
     async def test_endpoint(client: AsyncClient):
         response = await client.get("/api/v1/films/")
         assert response.status_code == 200
     ```
 """
 
+import asyncio
+import orjson
+import os
 import pytest
 import sqlite3
-from typing import AsyncGenerator
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Generator
 from datetime import datetime
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from httpx import ASGITransport, AsyncClient, Headers, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 from fastapi.testclient import TestClient
 from app.main import app
 from core.dependencies import get_db_session
+from domain.repositories import FilmRepository, RentalRepository, CategoryRepository
+from domain.schemas import RentalCreate, RentalRead
+from domain.services import FilmService, RentalService, CategoryService
 
 
 # Configure SQLite datetime adapters to avoid deprecation warnings
@@ -45,68 +65,292 @@ def convert_datetime(val: bytes) -> datetime:
 
 # Register the adapters
 sqlite3.register_adapter(type(None), lambda x: None)
+sqlite3.register_adapter(datetime, adapt_datetime_iso)
+
+
+def fast_json(response: Response) -> Any:
+    """Parse a response body with orjson instead of httpx's json.loads.
+
+    Args:
+        response: HTTP response returned by the test client
+
+    Returns:
+        Any: Decoded JSON body
+    """
+    return orjson.loads(response.content)
+
+
+# Static request bodies are encoded once and sent with content=..., so httpx
+# does not re-run json.dumps on every request
+JSON_HEADERS = Headers({"Content-Type": "application/json"})
+RENTAL_DATA: Dict[str, Any] = {"inventory_id": 1, "customer_id": 1, "staff_id": 1}
+RENTAL_BODY = orjson.dumps(RENTAL_DATA)
+
+
+async def create_rental_direct(session: AsyncSession, **overrides: Any) -> RentalRead:
+    """Create a rental through the service layer for test setup.
+
+    Skips routing, request validation and JSON encoding/decoding; use the
+    client fixture when the create endpoint itself is under test.
+
+    Args:
+        session: Test database session
+        **overrides: RentalCreate fields replacing the RENTAL_DATA defaults
+
+    Returns:
+        RentalRead: The created rental
+    """
+    rental = RentalCreate(**(RENTAL_DATA | overrides))
+    return await RentalService(RentalRepository(session)).create_rental(rental)
 
-# Test database URL (use in-memory SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-# Create test engine
+# Test database URL. Defaults to in-memory SQLite, which lives in this
+# process, so each pytest-xdist worker gets its own. TEST_DATABASE_URL may
+# point at a disposable PostgreSQL database instead; the schema is still built
+# from the SQLModel metadata, which declares no FK or unique constraints.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+IS_SQLITE = TEST_DATABASE_URL.startswith("sqlite")
+
+# Seed data loaded once per session (one SQL statement per line)
+SEED_DIR = Path(__file__).parent / "fixtures"
+
+# Create test engine. For SQLite, StaticPool keeps the single in-memory
+# connection open for the whole session (tests use one connection at a time)
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
     future=True,
+    **(
+        {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}} if IS_SQLITE else {}
+    ),
 )
 
-TestSessionLocal = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
 
+def _disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+    """Stop the SQLite driver from opening transactions on its own."""
+    dbapi_connection.isolation_level = None
 
-@pytest.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+
+def _emit_begin(conn: Any) -> None:
+    """Open the transaction explicitly so SAVEPOINTs nest inside it."""
+    conn.exec_driver_sql("BEGIN")
+
+
+# pysqlite/aiosqlite manage transactions themselves and break SAVEPOINT
+# handling; let SQLAlchemy emit BEGIN so per-test savepoints work
+if IS_SQLITE:
+    event.listen(test_engine.sync_engine, "connect", _disable_driver_transactions)
+    event.listen(test_engine.sync_engine, "begin", _emit_begin)
+
+
+@pytest.fixture(scope="session")
+def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     """
-    Create a test database session.
+    Create one event loop for the whole test session.
+
+    Session-scoped async fixtures (the shared engine) must run on the same
+    loop as the tests that use them. uvloop is used when it is installed.
 
     Yields:
-        AsyncSession: Test database session
+        asyncio.AbstractEventLoop: Session event loop
+    """
+    loop: asyncio.AbstractEventLoop
+    try:
+        # uvloop ships with uvicorn[standard]; fall back to the stock loop
+        import uvloop
+
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def test_schema() -> AsyncGenerator[None, None]:
+    """
+    Create the database schema and load the seed data once per session.
+
+    The seed rows are committed before any test runs, so they sit below the
+    per-test savepoint: every test sees them and none can remove them.
+
+    Yields:
+        None
     """
     async with test_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        for seed_file in sorted(SEED_DIR.glob("*.sql")):
+            for line in seed_file.read_text(encoding="utf-8").splitlines():
+                statement = line.strip()
+                if statement and not statement.startswith("--"):
+                    await conn.exec_driver_sql(statement)
+        if not IS_SQLITE:
+            # The seed inserts explicit IDs, which do not advance PostgreSQL
+            # serial sequences; move them past the seeded rows
+            for table in SQLModel.metadata.sorted_tables:
+                for column in table.primary_key.columns:
+                    await conn.exec_driver_sql(
+                        f"SELECT setval(pg_get_serial_sequence('{table.name}', '{column.name}'), "
+                        f"COALESCE(MAX({column.name}), 0) + 1, false) FROM {table.name}"
+                    )
 
-    async with TestSessionLocal() as session:
-        yield session
+    yield
 
     async with test_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
+    await test_engine.dispose()
 
 
 @pytest.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    Create a test client with database session override.
+    Create a test database session rolled back after the test.
 
-    Args:
-        db_session: Test database session
+    The session is bound to a connection with an open outer transaction;
+    commits made by the code under test only release a SAVEPOINT, so the
+    rollback at teardown discards this test's changes. The committed seed
+    rows from test_schema are untouched and visible to every test.
 
     Yields:
-        AsyncClient: Test HTTP client
+        AsyncSession: Test database session
     """
-    from httpx import ASGITransport
+    async with test_engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await conn.rollback()
 
-    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        yield db_session
 
-    app.dependency_overrides[get_db_session] = override_get_db
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create one ASGI test client for the whole test session.
 
+    Tests get it through the client fixture and must not build their own
+    AsyncClient (CI checks this).
+
+    Yields:
+        AsyncClient: Test HTTP client bound to the application
+    """
     # Use the app directly as ASGI application
     transport = ASGITransport(app=app)  # type: ignore[arg-type]
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
+
+@pytest.fixture
+async def client(
+    http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Get the session test client with the database session overridden.
+
+    Args:
+        http_client: Session-scoped test HTTP client
+        db_session: Test database session
+
+    Yields:
+        AsyncClient: Test HTTP client using this test's database session
+    """
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        yield db_session
+
+    app.dependency_overrides[get_db_session] = override_get_db
+    yield http_client
     app.dependency_overrides.clear()
 
 
+class DirectClient:
+    """Services wired like core.dependencies, for calling route handlers directly.
+
+    Tests that only assert on the response payload can await a route handler
+    with these services instead of going through ASGI request/response
+    serialization. HTTP-level behaviour (status codes, headers, auth) stays
+    covered through the client fixture.
+
+    Attributes:
+        film_service: Film service bound to the test session
+        rental_service: Rental service bound to the test session
+        category_service: Category service bound to the test session
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.film_service = FilmService(FilmRepository(session))
+        self.rental_service = RentalService(RentalRepository(session))
+        self.category_service = CategoryService(CategoryRepository(session))
+
+
+@pytest.fixture
+def direct_client(db_session: AsyncSession) -> DirectClient:
+    """
+    Create services for calling route handlers without ASGI.
+
+    Args:
+        db_session: Test database session
+
+    Returns:
+        DirectClient: Services bound to the test session
+    """
+    return DirectClient(db_session)
+
+
+@pytest.fixture(scope="session")
+def auth_headers() -> Headers:
+    """
+    Create the Bearer token headers accepted by the dvd_ token guard.
+
+    Built once per session; httpx reuses the encoded header values.
+
+    Returns:
+        Headers: Authorization headers
+    """
+    return Headers({"Authorization": "Bearer dvd_test_token"})
+
+
+@pytest.fixture(scope="session")
+def auth_json_headers(auth_headers: Headers) -> Headers:
+    """
+    Combine the Bearer token and JSON content-type headers once per session.
+
+    Used for protected endpoints that take a pre-encoded JSON body.
+
+    Args:
+        auth_headers: Bearer token headers
+
+    Returns:
+        Headers: Authorization and Content-Type headers
+    """
+    headers = auth_headers.copy()
+    headers.update(JSON_HEADERS)
+    return headers
+
+
+@pytest.fixture
+async def created_rental(db_session: AsyncSession) -> Dict[str, Any]:
+    """
+    Create a rental for tests that operate on an existing one.
+
+    Created through the service layer rather than the API. Function-scoped:
+    the rental lives inside the test's savepoint and is rolled back with it.
+
+    Args:
+        db_session: Test database session
+
+    Returns:
+        Dict[str, Any]: The created rental in its API (JSON) representation
+    """
+    rental = await create_rental_direct(db_session)
+    return rental.model_dump(mode="json")
+
+
 @pytest.fixture
 def sync_client() -> TestClient:
     """
@@ -0,0 +1,15 @@
+-- Pagila sample rows loaded once per test session (see tests/conftest.py).
+-- Rows live below the per-test savepoint, so every test sees them and no
+-- test can remove them. One statement per line.
+
+INSERT INTO category (category_id, name, last_update) VALUES (1, 'Action', '2022-02-15 09:46:27.000000');
+INSERT INTO category (category_id, name, last_update) VALUES (2, 'Animation', '2022-02-15 09:46:27.000000');
+INSERT INTO category (category_id, name, last_update) VALUES (3, 'Children', '2022-02-15 09:46:27.000000');
+
+INSERT INTO film (film_id, title, description, release_year, language_id, rental_duration, rental_rate, length, replacement_cost, rating, streaming_available, last_update) VALUES (1, 'ACADEMY DINOSAUR', 'A Epic Drama of a Feminist And a Mad Scientist who must Battle a Teacher in The Canadian Rockies', 2012, 1, 6, 0.99, 86, 20.99, 'PG', FALSE, '2022-09-10 16:46:03.905795');
+INSERT INTO film (film_id, title, description, release_year, language_id, rental_duration, rental_rate, length, replacement_cost, rating, streaming_available, last_update) VALUES (2, 'ACE GOLDFINGER', 'A Astounding Epistle of a Database Administrator And a Explorer who must Find a Car in Ancient China', 2017, 1, 3, 4.99, 48, 12.99, 'G', FALSE, '2022-09-10 16:46:03.905795');
+INSERT INTO film (film_id, title, description, release_year, language_id, rental_duration, rental_rate, length, replacement_cost, rating, streaming_available, last_update) VALUES (3, 'ADAPTATION HOLES', 'A Astounding Reflection of a Lumberjack And a Car who must Sink a Lumberjack in A Baloon Factory', 2006, 1, 7, 2.99, 50, 18.99, 'NC-17', FALSE, '2022-09-10 16:46:03.905795');
+
+INSERT INTO rental (rental_id, rental_date, inventory_id, customer_id, return_date, staff_id, last_update) VALUES (1, '2022-05-24 22:53:30.000000', 367, 130, '2022-05-26 22:04:30.000000', 1, '2022-02-16 02:30:53.000000');
+INSERT INTO rental (rental_id, rental_date, inventory_id, customer_id, return_date, staff_id, last_update) VALUES (2, '2022-05-24 22:54:33.000000', 1525, 459, '2022-05-28 19:40:33.000000', 1, '2022-02-16 02:30:53.000000');
+INSERT INTO rental (rental_id, rental_date, inventory_id, customer_id, return_date, staff_id, last_update) VALUES (3, '2022-05-24 23:03:39.000000', 1711, 408, '2022-06-01 22:12:39.000000', 1, '2022-02-16 02:30:53.000000');
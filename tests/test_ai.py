@@ -1,62 +1,94 @@
 """Happy-path tests for AI endpoints.
 
 This module contains one happy-path test per AI endpoint.
-AI service methods are mocked to avoid actual API calls.
+AI service methods are mocked to avoid actual API calls; the patches are
+applied once for the whole module and reset between tests.
 """
 
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch
-from typing import AsyncGenerator
+from unittest.mock import DEFAULT, MagicMock, patch
+from typing import AsyncGenerator, Dict, Generator
+from tests.conftest import fast_json
 
 
-@pytest.mark.asyncio
-async def test_ask_question(client: AsyncClient) -> None:
+@pytest.fixture(scope="module", autouse=True)
+def patch_ai_services() -> Generator[Dict[str, MagicMock], None, None]:
+    """
+    Patch the AI service methods once for every test in this module.
+
+    Yields:
+        Dict[str, MagicMock]: Mocks keyed by patched method name
+    """
+    with patch.multiple(
+        "domain.services.ai_service.AIService", stream_chat=DEFAULT, get_film_summary=DEFAULT
+    ) as ai_mocks, patch(
+        "domain.services.handoff_service.HandoffService.process_question"
+    ) as mock_handoff:
+        yield {**ai_mocks, "process_question": mock_handoff}
+
+
+@pytest.fixture
+def ai_mocks(patch_ai_services: Dict[str, MagicMock]) -> Dict[str, MagicMock]:
+    """
+    Get the module's AI mocks with calls and return values reset.
+
+    Args:
+        patch_ai_services: Module-scoped mocks
+
+    Returns:
+        Dict[str, MagicMock]: Mocks keyed by patched method name
+    """
+    for mock in patch_ai_services.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return patch_ai_services
+
+
+async def test_ask_question(client: AsyncClient, ai_mocks: Dict[str, MagicMock]) -> None:
     """Happy-path: Ask a question to the AI and get streaming response."""
-    with patch("domain.services.ai_service.AIService.stream_chat") as mock_stream:
 
-        async def mock_stream_generator() -> AsyncGenerator[str, None]:
-            yield "Hello"
-            yield " "
-            yield "World"
+    async def mock_stream_generator() -> AsyncGenerator[str, None]:
+        yield "Hello"
+        yield " "
+        yield "World"
 
-        mock_stream.return_value = mock_stream_generator()
+    ai_mocks["stream_chat"].return_value = mock_stream_generator()
 
-        response = await client.get("/api/v1/ai/ask?question=hello")
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    response = await client.get("/api/v1/ai/ask?question=hello")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
 
 
-@pytest.mark.asyncio
-async def test_get_film_summary(client: AsyncClient) -> None:
+async def test_get_film_summary(client: AsyncClient, ai_mocks: Dict[str, MagicMock]) -> None:
     """Happy-path: Get AI-generated summary for a film."""
-    with patch("domain.services.ai_service.AIService.get_film_summary") as mock_summary:
-        mock_summary.return_value = {"title": "Test Film", "rating": "PG-13", "recommended": True}
+    ai_mocks["get_film_summary"].return_value = {
+        "title": "Test Film",
+        "rating": "PG-13",
+        "recommended": True,
+    }
 
-        request_data = {"film_id": 1}
-        response = await client.post("/api/v1/ai/summary", json=request_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert data["title"] == "Test Film"
-        assert data["rating"] == "PG-13"
-        assert data["recommended"] is True
+    request_data = {"film_id": 1}
+    response = await client.post("/api/v1/ai/summary", json=request_data)
+    assert response.status_code == 200
+    data = fast_json(response)
+    assert data["title"] == "Test Film"
+    assert data["rating"] == "PG-13"
+    assert data["recommended"] is True
 
 
-@pytest.mark.asyncio
-async def test_handoff_question(client: AsyncClient) -> None:
+async def test_handoff_question(client: AsyncClient, ai_mocks: Dict[str, MagicMock]) -> None:
     """Happy-path: Handoff endpoint routes question to appropriate agent."""
-    with patch("domain.services.handoff_service.HandoffService.process_question") as mock_handoff:
-        # Mock HandoffService to return a response
-        mock_handoff.return_value = {
-            "agent": "SearchAgent",
-            "answer": "Alien (Horror) rents for $2.99.",
-        }
-
-        request_data = {"question": "What is the rental rate for Alien?"}
-        response = await client.post("/api/v1/ai/handoff", json=request_data)
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["agent"] == "SearchAgent"
-        assert "answer" in data
-        assert mock_handoff.called
+    # Mock HandoffService to return a response
+    ai_mocks["process_question"].return_value = {
+        "agent": "SearchAgent",
+        "answer": "Alien (Horror) rents for $2.99.",
+    }
+
+    request_data = {"question": "What is the rental rate for Alien?"}
+    response = await client.post("/api/v1/ai/handoff", json=request_data)
+
+    assert response.status_code == 200
+    data = fast_json(response)
+    assert data["agent"] == "SearchAgent"
+    assert "answer" in data
+    assert ai_mocks["process_question"].called
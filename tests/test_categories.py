@@ -1,23 +1,35 @@
 """Happy-path tests for category endpoints.
 
-This module contains one happy-path test per category endpoint.
+This module contains one happy-path test per category endpoint. The list test
+calls its handler directly; the *_http test covers the same route over ASGI.
 """
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
+from api.v1 import category_routes
+from tests.conftest import DirectClient, fast_json
 
 
-@pytest.mark.asyncio
-async def test_get_categories(client: AsyncClient) -> None:
+async def test_get_categories(direct_client: DirectClient) -> None:
     """Happy-path: Get all categories with pagination."""
-    response = await client.get("/api/v1/categories?skip=0&limit=10")
-    assert response.status_code == 200
-    data = response.json()
+    data = await category_routes.get_categories(
+        skip=0, limit=10, service=direct_client.category_service
+    )
     assert isinstance(data, list)
 
 
-@pytest.mark.asyncio
+async def test_get_categories_http(client: AsyncClient) -> None:
+    """HTTP semantics: status, content type and pagination query parsing."""
+    response = await client.get("/api/v1/categories?skip=1&limit=1")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = fast_json(response)
+    assert [category["id"] for category in data] == [2]
+
+    response = await client.get("/api/v1/categories?limit=abc")
+    assert response.status_code == 422
+
+
 async def test_get_category_by_id(client: AsyncClient, db_session: AsyncSession) -> None:
     """Happy-path: Get category by ID."""
     # Create a category directly in the database for testing
@@ -33,6 +45,6 @@ async def test_get_category_by_id(client: AsyncClient, db_session: AsyncSession)
     # Then get it by ID via API
     response = await client.get(f"/api/v1/categories/{category_id}")
     assert response.status_code == 200
-    data = response.json()
+    data = fast_json(response)
     assert data["id"] == category_id
     assert data["name"] == "Test Category"
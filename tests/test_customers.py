@@ -1,30 +1,62 @@
 """Happy-path tests for customer endpoints.
 
-This module contains one happy-path test per customer endpoint.
+This module contains one happy-path test per customer endpoint. The list test
+calls its handler directly; the *_http test covers the same route over ASGI.
 """
 
-import pytest
-from httpx import AsyncClient
+import orjson
+from httpx import AsyncClient, Headers
+from typing import Any, Dict
+from api.v1 import customer_routes
+from tests.conftest import DirectClient, fast_json
 
+CUSTOMER_RENTAL_BODY = orjson.dumps({"inventory_id": 1, "staff_id": 1})
 
-@pytest.mark.asyncio
-async def test_get_customer_rentals(client: AsyncClient) -> None:
+
+async def test_get_customer_rentals(
+    direct_client: DirectClient, created_rental: Dict[str, Any]
+) -> None:
     """Happy-path: Get all rentals for a customer."""
-    # Use customer ID 1 (assuming it exists in test DB)
-    response = await client.get("/api/v1/customers/1/rentals?skip=0&limit=10")
+    response = await customer_routes.get_customer_rentals(
+        customer_id=created_rental["customer_id"],
+        skip=0,
+        limit=10,
+        service=direct_client.rental_service,
+    )
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.body)
     assert isinstance(data, list)
+    assert created_rental["id"] in [rental["id"] for rental in data]
+
+
+async def test_get_customer_rentals_http(
+    client: AsyncClient, created_rental: Dict[str, Any]
+) -> None:
+    """HTTP semantics: status, content type and query parsing of the ORJSONResponse route."""
+    customer_id = created_rental["customer_id"]
+    response = await client.get(f"/api/v1/customers/{customer_id}/rentals?skip=0&limit=1")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = fast_json(response)
+    assert len(data) == 1
+    assert data[0]["customer_id"] == customer_id
+
+    response = await client.get(f"/api/v1/customers/{customer_id}/rentals?limit=abc")
+    assert response.status_code == 422
+
+    response = await client.get("/api/v1/customers/abc/rentals")
+    assert response.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_create_customer_rental(client: AsyncClient) -> None:
+async def test_create_customer_rental(client: AsyncClient, auth_json_headers: Headers) -> None:
     """Happy-path: Create a rental for a customer with Bearer token."""
-    rental_data = {"inventory_id": 1, "staff_id": 1}
-    headers = {"Authorization": "Bearer dvd_test_token"}
-    response = await client.post("/api/v1/customers/1/rentals", json=rental_data, headers=headers)
+    response = await client.post(
+        "/api/v1/customers/1/rentals",
+        content=CUSTOMER_RENTAL_BODY,
+        headers=auth_json_headers,
+    )
     assert response.status_code == 201
-    data = response.json()
+    data = fast_json(response)
     assert "id" in data
     assert data["customer_id"] == 1
     assert data["inventory_id"] == 1
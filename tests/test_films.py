@@ -1,248 +1,216 @@
 """Tests for film endpoints including validation tests.
 
 This module contains happy-path tests and validation tests for film endpoints,
-including tests for year constraint validation and other data validation.
+including tests for year constraint validation and other data validation,
+plus the repository and service batch lookups by ID.
 """
 
 import pytest
 from httpx import AsyncClient
-
-
-@pytest.mark.asyncio
-async def test_create_film(client: AsyncClient) -> None:
+from typing import Any, Dict, List, Set
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.models import Film
+from domain.repositories import FilmRepository
+from domain.schemas import FilmCreate, FilmRead, FilmUpdate
+from domain.services import FilmService
+from tests.conftest import fast_json
+
+# Valid create payload; validation tests override one field at a time
+VALID_FILM: Dict[str, Any] = {
+    "title": "Validation Film",
+    "language_id": 1,
+    "rental_duration": 3,
+    "rental_rate": 4.99,
+    "replacement_cost": 19.99,
+}
+
+# Films loaded once per session by tests/fixtures/pagila_seed.sql
+SEED_FILM_IDS = (1, 2, 3)
+
+
+@pytest.fixture
+def film_id() -> int:
+    """
+    Return a seeded film for tests that operate on an existing one.
+
+    The seed rows sit below the per-test savepoint, so updates and deletes
+    are rolled back and no setup POST is needed.
+
+    Returns:
+        int: ID of the first seeded film
+    """
+    return SEED_FILM_IDS[0]
+
+
+@pytest.mark.parametrize(
+    "film_data",
+    [
+        {"title": "Test Film", "language_id": 1, "rental_duration": 3},
+        {
+            "title": "Test Film",
+            "language_id": 1,
+            "rental_duration": 3,
+            "rental_rate": 4.99,
+            "replacement_cost": 19.99,
+        },
+        {
+            "title": "Test Film",
+            "description": "A film created by the test suite",
+            "language_id": 1,
+            "rental_duration": 3,
+            "rental_rate": 4.99,
+            "replacement_cost": 19.99,
+            "length": 90,
+            "rating": "PG-13",
+        },
+    ],
+    ids=["minimal", "pricing", "full"],
+)
+async def test_create_film(client: AsyncClient, film_data: Dict[str, Any]) -> None:
     """Happy-path: Create a new film."""
-    film_data = {
-        "title": "Test Film",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-    }
     response = await client.post("/api/v1/films/", json=film_data)
     assert response.status_code == 201
-    data = response.json()
-    assert data["title"] == "Test Film"
-    assert data["rental_duration"] == 3
+    data = fast_json(response)
+    for field, value in film_data.items():
+        assert data[field] == value
 
 
-@pytest.mark.asyncio
 async def test_get_films(client: AsyncClient) -> None:
     """Happy-path: Get all films with pagination."""
     response = await client.get("/api/v1/films/?skip=0&limit=10")
     assert response.status_code == 200
-    data = response.json()
+    data = fast_json(response)
     assert isinstance(data, list)
+    assert len(data) == len(SEED_FILM_IDS)
+    # JSON types must match FilmRead whatever the driver returned
+    film = data[0]
+    assert film["id"] == SEED_FILM_IDS[0]
+    assert isinstance(film["rental_rate"], float)
+    assert isinstance(film["replacement_cost"], float)
+    assert isinstance(film["streaming_available"], bool)
+    assert film["last_update"] == "2022-09-10T16:46:03.905795"
+
+
+async def test_film_lifecycle(client: AsyncClient) -> None:
+    """Happy-path: Create, read, update and delete one film."""
+    film_data = {"title": "Lifecycle Film", "language_id": 1, "rental_duration": 3}
+    response = await client.post("/api/v1/films/", json=film_data)
+    assert response.status_code == 201
+    film_id = fast_json(response)["id"]
 
-
-@pytest.mark.asyncio
-async def test_get_film_by_id(client: AsyncClient) -> None:
-    """Happy-path: Get film by ID."""
-    # First create a film
-    film_data = {"title": "Test Film ID", "language_id": 1, "rental_duration": 3}
-    create_response = await client.post("/api/v1/films/", json=film_data)
-    assert create_response.status_code == 201
-    film_id = create_response.json()["id"]
-
-    # Then get it by ID
+    # The steps share the test's database session, so they run in order
     response = await client.get(f"/api/v1/films/{film_id}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == film_id
-    assert data["title"] == "Test Film ID"
-
-
-@pytest.mark.asyncio
-async def test_update_film(client: AsyncClient) -> None:
-    """Happy-path: Update a film."""
-    # First create a film
-    film_data = {"title": "Original Title", "language_id": 1, "rental_duration": 3}
-    create_response = await client.post("/api/v1/films/", json=film_data)
-    assert create_response.status_code == 201
-    film_id = create_response.json()["id"]
-
-    # Then update it
-    update_data = {"title": "Updated Title"}
-    response = await client.put(f"/api/v1/films/{film_id}", json=update_data)
-    assert response.status_code == 200
-    data = response.json()
-    assert data["title"] == "Updated Title"
-
+    assert fast_json(response)["title"] == "Lifecycle Film"
 
-@pytest.mark.asyncio
-async def test_delete_film(client: AsyncClient) -> None:
-    """Happy-path: Delete a film."""
-    # First create a film
-    film_data = {"title": "Film to Delete", "language_id": 1, "rental_duration": 3}
-    create_response = await client.post("/api/v1/films/", json=film_data)
-    assert create_response.status_code == 201
-    film_id = create_response.json()["id"]
+    response = await client.put(f"/api/v1/films/{film_id}", json={"title": "Updated Title"})
+    assert response.status_code == 200
+    assert fast_json(response)["title"] == "Updated Title"
 
-    # Then delete it
     response = await client.delete(f"/api/v1/films/{film_id}")
     assert response.status_code == 204
 
+    response = await client.get(f"/api/v1/films/{film_id}")
+    assert response.status_code == 404
+
 
 # Validation Tests
+#
+# One test goes through the HTTP stack to cover the 422 response; the rest
+# exercise the schema validators directly.
 
 
-@pytest.mark.asyncio
-async def test_create_film_invalid_year_too_low(client: AsyncClient) -> None:
-    """Test validation: Create film with year below 1901 should fail."""
-    film_data = {
-        "title": "Ancient Film",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-        "release_year": 1900,  # Below minimum (1901)
-    }
+async def test_create_film_invalid_year_http(client: AsyncClient) -> None:
+    """Test validation: The API answers 422 for a film with year below 1901."""
+    film_data = VALID_FILM | {"release_year": 1900}  # Below minimum (1901)
     response = await client.post("/api/v1/films/", json=film_data)
     assert response.status_code == 422  # Pydantic validation error
-    data = response.json()
+    data = fast_json(response)
     assert "release year must be between 1901 and 2155" in data["detail"][0]["msg"].lower()
 
 
-@pytest.mark.asyncio
-async def test_create_film_invalid_year_too_high(client: AsyncClient) -> None:
-    """Test validation: Create film with year above 2155 should fail."""
-    film_data = {
-        "title": "Future Film",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-        "release_year": 2156,  # Above maximum (2155)
-    }
+@pytest.mark.parametrize(
+    "field, value, message",
+    [
+        ("release_year", 1900, "release year must be between 1901 and 2155"),
+        ("release_year", 2156, "release year must be between 1901 and 2155"),
+        ("rental_duration", -1, "rental duration must be positive"),
+        ("rental_rate", -4.99, "amount must be positive"),
+        ("replacement_cost", -19.99, "amount must be positive"),
+        ("length", -120, "film length must be positive"),
+    ],
+    ids=[
+        "year-too-low",
+        "year-too-high",
+        "rental-duration",
+        "rental-rate",
+        "replacement-cost",
+        "length",
+    ],
+)
+def test_create_film_validation(field: str, value: Any, message: str) -> None:
+    """Test validation: FilmCreate rejects an out-of-range field value."""
+    with pytest.raises(ValidationError) as exc_info:
+        FilmCreate(**(VALID_FILM | {field: value}))
+    assert message in str(exc_info.value).lower()
+
+
+@pytest.mark.parametrize("release_year", [1901, 2155], ids=["min", "max"])
+async def test_create_film_valid_year_boundaries(client: AsyncClient, release_year: int) -> None:
+    """Test validation: Create film with a boundary release year should succeed."""
+    film_data = VALID_FILM | {"release_year": release_year}
     response = await client.post("/api/v1/films/", json=film_data)
-    assert response.status_code == 422  # Pydantic validation error
-    data = response.json()
-    assert "release year must be between 1901 and 2155" in data["detail"][0]["msg"].lower()
-
-
-@pytest.mark.asyncio
-async def test_create_film_valid_year_boundaries(client: AsyncClient) -> None:
-    """Test validation: Create film with valid boundary years should succeed."""
-    # Test minimum valid year (1901)
-    film_data_min = {
-        "title": "Early Film",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-        "release_year": 1901,
-    }
-    response = await client.post("/api/v1/films/", json=film_data_min)
     assert response.status_code == 201
-    data = response.json()
-    assert data["release_year"] == 1901
-
-    # Test maximum valid year (2155)
-    film_data_max = {
-        "title": "Future Film",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-        "release_year": 2155,
-    }
-    response = await client.post("/api/v1/films/", json=film_data_max)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["release_year"] == 2155
-
-
-@pytest.mark.asyncio
-async def test_create_film_negative_rental_duration(client: AsyncClient) -> None:
-    """Test validation: Create film with negative rental duration should fail."""
-    film_data = {
-        "title": "Invalid Duration Film",
-        "language_id": 1,
-        "rental_duration": -1,  # Invalid negative duration
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-    }
-    response = await client.post("/api/v1/films/", json=film_data)
-    assert response.status_code == 422  # Pydantic validation error
-    data = response.json()
-    assert "rental duration must be positive" in data["detail"][0]["msg"].lower()
-
-
-@pytest.mark.asyncio
-async def test_create_film_negative_rental_rate(client: AsyncClient) -> None:
-    """Test validation: Create film with negative rental rate should fail."""
-    film_data = {
-        "title": "Invalid Rate Film",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": -4.99,  # Invalid negative rate
-        "replacement_cost": 19.99,
-    }
-    response = await client.post("/api/v1/films/", json=film_data)
-    assert response.status_code == 422  # Pydantic validation error
-    data = response.json()
-    assert "amount must be positive" in data["detail"][0]["msg"].lower()
-
-
-@pytest.mark.asyncio
-async def test_create_film_negative_length(client: AsyncClient) -> None:
-    """Test validation: Create film with negative length should fail."""
-    film_data = {
-        "title": "Invalid Length Film",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-        "length": -120,  # Invalid negative length
-    }
-    response = await client.post("/api/v1/films/", json=film_data)
-    assert response.status_code == 422  # Pydantic validation error
-    data = response.json()
-    assert "film length must be positive" in data["detail"][0]["msg"].lower()
+    data = fast_json(response)
+    assert data["release_year"] == release_year
 
 
-@pytest.mark.asyncio
-async def test_update_film_invalid_year(client: AsyncClient) -> None:
+def test_update_film_invalid_year() -> None:
     """Test validation: Update film with invalid year should fail."""
-    # First create a valid film
-    film_data = {
-        "title": "Film to Update",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-        "release_year": 2000,
-    }
-    create_response = await client.post("/api/v1/films/", json=film_data)
-    assert create_response.status_code == 201
-    film_id = create_response.json()["id"]
-
-    # Try to update with invalid year
     update_data = {"release_year": 1800}  # Below minimum (1901)
-    response = await client.put(f"/api/v1/films/{film_id}", json=update_data)
-    assert response.status_code == 422  # Pydantic validation error
-    data = response.json()
-    assert "release year must be between 1901 and 2155" in data["detail"][0]["msg"].lower()
+    with pytest.raises(ValidationError) as exc_info:
+        FilmUpdate(**update_data)
+    assert "release year must be between 1901 and 2155" in str(exc_info.value).lower()
 
 
-@pytest.mark.asyncio
-async def test_update_film_valid_year(client: AsyncClient) -> None:
+async def test_update_film_valid_year(client: AsyncClient, film_id: int) -> None:
     """Test validation: Update film with valid year should succeed."""
-    # First create a valid film
-    film_data = {
-        "title": "Film to Update Valid",
-        "language_id": 1,
-        "rental_duration": 3,
-        "rental_rate": 4.99,
-        "replacement_cost": 19.99,
-        "release_year": 2000,
-    }
-    create_response = await client.post("/api/v1/films/", json=film_data)
-    assert create_response.status_code == 201
-    film_id = create_response.json()["id"]
-
-    # Update with valid year
     update_data = {"release_year": 2020}  # Valid year
     response = await client.put(f"/api/v1/films/{film_id}", json=update_data)
     assert response.status_code == 200
-    data = response.json()
+    data = fast_json(response)
     assert data["release_year"] == 2020
+
+
+# (requested IDs, IDs expected back) for the batch lookups
+BATCH_LOOKUPS = pytest.mark.parametrize(
+    "requested, expected",
+    [([1, 2], {1, 2}), ([1, 99999], {1}), ([1, 1], {1}), ([], set())],
+    ids=["found", "missing", "duplicates", "empty"],
+)
+
+
+@BATCH_LOOKUPS
+async def test_repository_get_by_ids(
+    db_session: AsyncSession, requested: List[int], expected: Set[int]
+) -> None:
+    """Test FilmRepository.get_by_ids returns one entity per existing ID."""
+    films = await FilmRepository(db_session).get_by_ids(requested)
+    assert len(films) == len(expected)
+    assert {film.id for film in films} == expected
+    assert all(isinstance(film, Film) for film in films)
+
+
+@BATCH_LOOKUPS
+async def test_service_get_films_by_ids(
+    db_session: AsyncSession, requested: List[int], expected: Set[int]
+) -> None:
+    """Test FilmService.get_films_by_ids maps each existing ID to a FilmRead."""
+    films = await FilmService(FilmRepository(db_session)).get_films_by_ids(requested)
+    assert set(films) == expected
+    for film_id, film in films.items():
+        assert isinstance(film, FilmRead)
+        assert film.id == film_id
+        assert isinstance(film.rental_rate, float)
+        assert isinstance(film.streaming_available, bool)
@@ -0,0 +1,37 @@
+"""Tests for the Alembic migration scripts.
+
+This module checks the migration history itself (no database required):
+every revision id must be unique and the history must form a single chain.
+"""
+
+import warnings
+from pathlib import Path
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+def _script_directory() -> ScriptDirectory:
+    """Load the migration scripts configured in alembic.ini."""
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    return ScriptDirectory.from_config(config)
+
+
+def test_unique_revisions() -> None:
+    """Each migration file must declare its own revision id."""
+    script_directory = _script_directory()
+    # Alembic keeps one script per revision id and only warns about the rest,
+    # so the duplicate warning is what this test has to catch
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "error", message="Revision .* is present more than once", category=UserWarning
+        )
+        revisions = list(script_directory.walk_revisions())
+    assert len(revisions) > 0
+
+
+def test_single_head() -> None:
+    """Migrations must form one linear history (no duplicated branches)."""
+    assert len(_script_directory().get_heads()) == 1
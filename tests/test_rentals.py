@@ -1,110 +1,157 @@
 """Happy-path tests for rental endpoints.
 
-This module contains one happy-path test per rental endpoint.
+This module walks one rental through the CRUD endpoints, covers the batch
+lookups, and documents the constraint errors expected on PostgreSQL.
 """
 
+import orjson
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime
 from httpx import AsyncClient
+from typing import List, Set
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.models import Rental
+from domain.repositories import RentalRepository
+from domain.schemas import RentalRead
+from domain.services import RentalService
+from tests.conftest import JSON_HEADERS, RENTAL_BODY, RENTAL_DATA, TEST_DATABASE_URL, fast_json
 
+# Rental loaded once per session by tests/fixtures/pagila_seed.sql
+SEED_RENTAL_ID = 1
 
-@pytest.mark.asyncio
-async def test_create_rental(client: AsyncClient) -> None:
-    """Happy-path: Create a new rental."""
-    rental_data = {"inventory_id": 1, "customer_id": 1, "staff_id": 1}
-    response = await client.post("/api/v1/rentals/", json=rental_data)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["inventory_id"] == 1
-    assert data["customer_id"] == 1
+# Fixed rental timestamp so the duplicate-rental test posts identical rows
+RENTAL_DATE = "2024-06-01T12:00:00+00:00"
+# Fixed return date used by the update step
+RETURN_DATE = "2024-01-01T00:00:00"
+
+# Posted twice by the duplicate-rental test, so it is encoded once up front
+DUPLICATE_RENTAL_BODY = orjson.dumps(RENTAL_DATA | {"rental_date": RENTAL_DATE})
 
 
-@pytest.mark.asyncio
 async def test_get_rentals(client: AsyncClient) -> None:
     """Happy-path: Get all rentals with pagination."""
     response = await client.get("/api/v1/rentals/?skip=0&limit=10")
     assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
-
-
-@pytest.mark.asyncio
-async def test_get_rental_by_id(client: AsyncClient) -> None:
-    """Happy-path: Get rental by ID."""
-    # First create a rental
-    rental_data = {"inventory_id": 1, "customer_id": 1, "staff_id": 1}
-    create_response = await client.post("/api/v1/rentals/", json=rental_data)
-    assert create_response.status_code == 201
-    rental_id = create_response.json()["id"]
+    assert response.headers["content-type"] == "application/json"
+    assert response.content[:1] == b"[" and response.content[-1:] == b"]"
+    # The body is still decoded: the field types below need checking
+    data = fast_json(response)
+    assert SEED_RENTAL_ID in [rental["id"] for rental in data]
+    # Datetimes must be ISO 8601 whatever format the driver returned
+    rental = next(rental for rental in data if rental["id"] == SEED_RENTAL_ID)
+    assert rental["rental_date"] == "2022-05-24T22:53:30"
+    assert rental["last_update"] == "2022-02-16T02:30:53"
+
+
+async def test_rental_lifecycle(client: AsyncClient) -> None:
+    """Happy-path: Create, read, update and delete one rental."""
+    response = await client.post("/api/v1/rentals/", content=RENTAL_BODY, headers=JSON_HEADERS)
+    assert response.status_code == 201
+    data = fast_json(response)
+    assert data["inventory_id"] == 1
+    assert data["customer_id"] == 1
+    rental_id = data["id"]
 
-    # Then get it by ID
+    # The steps share the test's database session, so they run in order
     response = await client.get(f"/api/v1/rentals/{rental_id}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == rental_id
+    assert fast_json(response)["id"] == rental_id
 
-
-@pytest.mark.asyncio
-async def test_update_rental(client: AsyncClient) -> None:
-    """Happy-path: Update a rental."""
-    # First create a rental
-    rental_data = {"inventory_id": 1, "customer_id": 1, "staff_id": 1}
-    create_response = await client.post("/api/v1/rentals/", json=rental_data)
-    assert create_response.status_code == 201
-    rental_id = create_response.json()["id"]
-
-    # Then update it
-    update_data = {"return_date": "2024-01-01T00:00:00"}
+    update_data = {"return_date": RETURN_DATE}
     response = await client.put(f"/api/v1/rentals/{rental_id}", json=update_data)
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == rental_id
-
+    assert fast_json(response)["id"] == rental_id
 
-@pytest.mark.asyncio
-async def test_delete_rental(client: AsyncClient) -> None:
-    """Happy-path: Delete a rental."""
-    # First create a rental
-    rental_data = {"inventory_id": 1, "customer_id": 1, "staff_id": 1}
-    create_response = await client.post("/api/v1/rentals/", json=rental_data)
-    assert create_response.status_code == 201
-    rental_id = create_response.json()["id"]
-
-    # Then delete it
     response = await client.delete(f"/api/v1/rentals/{rental_id}")
     assert response.status_code == 204
 
-    # Verify it's deleted
-    get_response = await client.get(f"/api/v1/rentals/{rental_id}")
-    assert get_response.status_code == 404
+    response = await client.get(f"/api/v1/rentals/{rental_id}")
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "rental_id, status_code",
+    [(SEED_RENTAL_ID, 200), (99999, 404)],
+    ids=["found", "not-found"],
+)
+async def test_get_rental(client: AsyncClient, rental_id: int, status_code: int) -> None:
+    """Get rental by ID: a seeded rental is returned, an unknown id is a 404."""
+    response = await client.get(f"/api/v1/rentals/{rental_id}")
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert fast_json(response)["id"] == rental_id
+
+
+# (requested IDs, IDs expected back) for the batch lookups
+BATCH_LOOKUPS = pytest.mark.parametrize(
+    "requested, expected",
+    [([1, 2], {1, 2}), ([1, 99999], {1}), ([1, 1], {1}), ([], set())],
+    ids=["found", "missing", "duplicates", "empty"],
+)
+
+
+@BATCH_LOOKUPS
+async def test_repository_get_by_ids(
+    db_session: AsyncSession, requested: List[int], expected: Set[int]
+) -> None:
+    """Test RentalRepository.get_by_ids returns one entity per existing ID."""
+    rentals = await RentalRepository(db_session).get_by_ids(requested)
+    assert len(rentals) == len(expected)
+    assert {rental.id for rental in rentals} == expected
+    assert all(isinstance(rental, Rental) for rental in rentals)
+
+
+@BATCH_LOOKUPS
+async def test_service_get_rentals_by_ids(
+    db_session: AsyncSession, requested: List[int], expected: Set[int]
+) -> None:
+    """Test RentalService.get_rentals_by_ids maps each existing ID to a RentalRead."""
+    rentals = await RentalService(RentalRepository(db_session)).get_rentals_by_ids(requested)
+    assert set(rentals) == expected
+    for rental_id, rental in rentals.items():
+        assert isinstance(rental, RentalRead)
+        assert rental.id == rental_id
+        assert isinstance(rental.rental_date, datetime)
+        assert isinstance(rental.last_update, datetime)
 
 
 # NOTE: The following tests are designed for PostgreSQL production environment
 # In the test environment (SQLite), these constraints may not be enforced
-# These tests serve as documentation of expected behavior in production
+# These tests serve as documentation of expected behavior in production.
+# The 400 branches need the FK and unique constraints of the real Pagila
+# schema; the test schema built from the SQLModel metadata declares none, so
+# even on PostgreSQL they take the 201 branch. They only run when
+# TEST_DATABASE_URL points at PostgreSQL.
+
+pg_only = pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith("postgresql"),
+    reason="needs PostgreSQL; the constraint errors also need the real Pagila schema",
+)
 
 
-@pytest.mark.asyncio
+@pg_only
 async def test_create_rental_duplicate_constraint(client: AsyncClient) -> None:
     """Test duplicate rental constraint violation handling.
 
     Note: This test documents expected behavior in PostgreSQL production.
     SQLite test environment may not enforce the unique constraint.
     """
-    # Use a specific timestamp to ensure collision
-    rental_date = datetime.now(timezone.utc).isoformat()
-    rental_data = {"inventory_id": 1, "customer_id": 1, "staff_id": 1, "rental_date": rental_date}
+    # Both requests carry the same rental_date (RENTAL_DATE) to ensure collision
 
     # First rental should succeed
-    response1 = await client.post("/api/v1/rentals/", json=rental_data)
+    response1 = await client.post(
+        "/api/v1/rentals/", content=DUPLICATE_RENTAL_BODY, headers=JSON_HEADERS
+    )
     assert response1.status_code == 201
 
     # Second rental with same data - behavior depends on database
-    response2 = await client.post("/api/v1/rentals/", json=rental_data)
+    response2 = await client.post(
+        "/api/v1/rentals/", content=DUPLICATE_RENTAL_BODY, headers=JSON_HEADERS
+    )
     # In PostgreSQL: should fail with 400
     # In SQLite test: may succeed due to lack of constraint enforcement
     if response2.status_code == 400:
-        error_detail = response2.json()["detail"]
+        error_detail = fast_json(response2)["detail"]
         assert "already exists" in error_detail.lower()
         assert "same customer cannot rent the same item at the same time" in error_detail.lower()
     else:
@@ -112,68 +159,60 @@ async def test_create_rental_duplicate_constraint(client: AsyncClient) -> None:
         assert response2.status_code == 201
 
 
-@pytest.mark.asyncio
+@pg_only
 async def test_create_rental_invalid_inventory_id(client: AsyncClient) -> None:
     """Test rental creation with invalid inventory_id.
 
     Note: This test documents expected behavior in PostgreSQL production.
     SQLite test environment may not enforce foreign key constraints.
     """
-    rental_data = {
-        "inventory_id": 99999,  # Non-existent inventory_id
-        "customer_id": 1,
-        "staff_id": 1,
-    }
+    rental_data = RENTAL_DATA | {"inventory_id": 99999}  # Non-existent inventory_id
 
     response = await client.post("/api/v1/rentals/", json=rental_data)
     # In PostgreSQL: should fail with 400
     # In SQLite test: may succeed due to lack of FK constraint enforcement
     if response.status_code == 400:
-        error_detail = response.json()["detail"]
+        error_detail = fast_json(response)["detail"]
         assert "invalid inventory_id" in error_detail.lower()
     else:
         # SQLite allows invalid FK, which is expected in test environment
         assert response.status_code == 201
 
 
-@pytest.mark.asyncio
+@pg_only
 async def test_create_rental_invalid_customer_id(client: AsyncClient) -> None:
     """Test rental creation with invalid customer_id.
 
     Note: This test documents expected behavior in PostgreSQL production.
     SQLite test environment may not enforce foreign key constraints.
     """
-    rental_data = {
-        "inventory_id": 1,
-        "customer_id": 99999,  # Non-existent customer_id
-        "staff_id": 1,
-    }
+    rental_data = RENTAL_DATA | {"customer_id": 99999}  # Non-existent customer_id
 
     response = await client.post("/api/v1/rentals/", json=rental_data)
     # In PostgreSQL: should fail with 400
     # In SQLite test: may succeed due to lack of FK constraint enforcement
     if response.status_code == 400:
-        error_detail = response.json()["detail"]
+        error_detail = fast_json(response)["detail"]
         assert "invalid customer_id" in error_detail.lower()
     else:
         # SQLite allows invalid FK, which is expected in test environment
         assert response.status_code == 201
 
 
-@pytest.mark.asyncio
+@pg_only
 async def test_create_rental_invalid_staff_id(client: AsyncClient) -> None:
     """Test rental creation with invalid staff_id.
 
     Note: This test documents expected behavior in PostgreSQL production.
     SQLite test environment may not enforce foreign key constraints.
     """
-    rental_data = {"inventory_id": 1, "customer_id": 1, "staff_id": 99999}  # Non-existent staff_id
+    rental_data = RENTAL_DATA | {"staff_id": 99999}  # Non-existent staff_id
 
     response = await client.post("/api/v1/rentals/", json=rental_data)
     # In PostgreSQL: should fail with 400
     # In SQLite test: may succeed due to lack of FK constraint enforcement
     if response.status_code == 400:
-        error_detail = response.json()["detail"]
+        error_detail = fast_json(response)["detail"]
         assert "invalid staff_id" in error_detail.lower()
     else:
         # SQLite allows invalid FK, which is expected in test environment